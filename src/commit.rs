@@ -1,17 +1,62 @@
 //! Commit struct creation and validation.
 
+use std::ops::Range;
+use std::sync::Mutex;
+
 use pyo3::prelude::*;
 
-use crate::validation::{Validation, ValidationConfig, validate_commit};
+use crate::validation::{ConfigKey, Validation, ValidationConfig, validate_commit};
+
+/// Number of distinct configs whose `validate` results a commit remembers.
+const VALIDATE_CACHE_SIZE: usize = 4;
+
+/// Recent `validate` results, keyed by the config settings that produced them.
+///
+/// Starts as an empty `Vec`, so commits that are never validated from Python
+/// do not allocate for it.
+type ValidateCache = Mutex<Vec<(ConfigKey, Vec<Validation>)>>;
 
 /// A git commit with its metadata.
 #[pyclass]
-#[derive(Debug, Clone)]
+#[derive(Debug)]
 pub struct Commit {
     pub(crate) hash: String,
     pub(crate) author_name: String,
     pub(crate) author_email: String,
     pub(crate) subject: String,
+    pub(crate) validate_cache: ValidateCache,
+}
+
+// Clones start with an empty validate cache.
+impl Clone for Commit {
+    fn clone(&self) -> Self {
+        Self {
+            hash: self.hash.clone(),
+            author_name: self.author_name.clone(),
+            author_email: self.author_email.clone(),
+            subject: self.subject.clone(),
+            validate_cache: Default::default(),
+        }
+    }
+}
+
+impl Commit {
+    fn cached_validations(&self, key: &ConfigKey) -> Option<Vec<Validation>> {
+        let cache = self.validate_cache.lock().ok()?;
+        cache
+            .iter()
+            .find(|(cached_key, _)| cached_key == key)
+            .map(|(_, validations)| validations.clone())
+    }
+
+    fn store_validations(&self, key: ConfigKey, validations: Vec<Validation>) {
+        if let Ok(mut cache) = self.validate_cache.lock() {
+            if cache.len() >= VALIDATE_CACHE_SIZE {
+                cache.remove(0);
+            }
+            cache.push((key, validations));
+        }
+    }
 }
 
 #[pymethods]
@@ -42,16 +87,182 @@ impl Commit {
 
     /// Validate this commit against all rules.
     ///
+    /// Args:
+    ///     threshold: Minimum message length (default: 30). Ignored if config is given.
+    ///     config: ValidationConfig to validate against. Pass the same config when
+    ///             validating many commits so it is built only once.
+    ///
     /// Returns:
-    ///     List of Validation types that failed.
-    #[pyo3(signature = (threshold=30))]
-    pub fn validate(&self, threshold: usize) -> Vec<Validation> {
-        let mut config = ValidationConfig::default();
-        config.threshold = threshold;
-        validate_commit(self, &config)
+    ///     List of Validation types that failed. Results are remembered for the
+    ///     last few distinct configs, so repeated calls skip re-validation.
+    #[pyo3(signature = (threshold=30, config=None))]
+    pub fn validate(
+        &self,
+        threshold: usize,
+        config: Option<PyRef<'_, ValidationConfig>>,
+    ) -> Vec<Validation> {
+        let default_config;
+        let config = match config.as_deref() {
+            Some(config) => config,
+            None => {
+                default_config = ValidationConfig::with_threshold(threshold);
+                &default_config
+            }
+        };
+
+        let key = config.cache_key();
+        if let Some(validations) = self.cached_validations(&key) {
+            return validations;
+        }
+
+        let validations: Vec<Validation> = validate_commit(self, config)
             .into_iter()
             .map(|f| f.validation)
-            .collect()
+            .collect();
+        self.store_validations(key, validations.clone());
+        validations
+    }
+}
+
+/// Commits stored column-wise over the raw `git log` output.
+///
+/// Every field is a byte range into one shared buffer, so a fetch allocates
+/// once for the whole batch instead of four strings per commit. `Commit`
+/// objects are only built when an item is accessed.
+#[pyclass]
+#[derive(Debug, Clone, Default)]
+pub struct CommitBatch {
+    buffer: String,
+    hashes: Vec<Range<usize>>,
+    author_names: Vec<Range<usize>>,
+    author_emails: Vec<Range<usize>>,
+    subjects: Vec<Range<usize>>,
+}
+
+impl CommitBatch {
+    /// Build a batch from `git log --pretty=format:%H|%an|%ae|%s` output.
+    pub(crate) fn from_log_output(buffer: String) -> Self {
+        let mut batch = Self::default();
+        let mut line_start = 0;
+
+        for line in buffer.split('\n') {
+            if !line.is_empty() {
+                match field_ranges(line, line_start) {
+                    Some([hash, author_name, author_email, subject]) => {
+                        batch.hashes.push(hash);
+                        batch.author_names.push(author_name);
+                        batch.author_emails.push(author_email);
+                        batch.subjects.push(subject);
+                    }
+                    None => {
+                        eprintln!("Warning: Could not parse commit line");
+                    }
+                }
+            }
+            line_start += line.len() + 1;
+        }
+
+        batch.buffer = buffer;
+        batch
+    }
+
+    pub fn len(&self) -> usize {
+        self.hashes.len()
+    }
+
+    pub fn is_empty(&self) -> bool {
+        self.hashes.is_empty()
+    }
+
+    pub fn get(&self, index: usize) -> Option<Commit> {
+        Some(Commit {
+            hash: self.field(self.hashes.get(index)?).to_string(),
+            author_name: self.field(self.author_names.get(index)?).to_string(),
+            author_email: self.field(self.author_emails.get(index)?).to_string(),
+            subject: self.field(self.subjects.get(index)?).to_string(),
+            validate_cache: Default::default(),
+        })
+    }
+
+    /// Subject of the commit at `index`, without building a `Commit`.
+    pub fn subject(&self, index: usize) -> Option<&str> {
+        self.subjects.get(index).map(|range| self.field(range))
+    }
+
+    pub fn iter(&self) -> impl Iterator<Item = Commit> + '_ {
+        (0..self.len()).filter_map(|index| self.get(index))
+    }
+
+    fn field(&self, range: &Range<usize>) -> &str {
+        self.buffer.get(range.clone()).unwrap_or_default()
+    }
+
+    fn column(&self, ranges: &[Range<usize>]) -> Vec<&str> {
+        ranges.iter().map(|range| self.field(range)).collect()
+    }
+}
+
+/// Split a `hash|name|email|subject` line into byte ranges of the whole buffer.
+/// Pipes after the third belong to the subject.
+fn field_ranges(line: &str, line_start: usize) -> Option<[Range<usize>; 4]> {
+    let mut separators = line.match_indices('|').map(|(i, _)| line_start + i);
+    let first = separators.next()?;
+    let second = separators.next()?;
+    let third = separators.next()?;
+    Some([
+        line_start..first,
+        first + 1..second,
+        second + 1..third,
+        third + 1..line_start + line.len(),
+    ])
+}
+
+#[pymethods]
+impl CommitBatch {
+    fn __len__(&self) -> usize {
+        self.len()
+    }
+
+    fn __getitem__(&self, index: isize) -> PyResult<Commit> {
+        let resolved = if index < 0 {
+            index.checked_add_unsigned(self.len())
+        } else {
+            Some(index)
+        };
+        resolved
+            .and_then(|i| usize::try_from(i).ok())
+            .and_then(|i| self.get(i))
+            .ok_or_else(|| {
+                PyErr::new::<pyo3::exceptions::PyIndexError, _>("CommitBatch index out of range")
+            })
+    }
+
+    /// Hashes of all commits in the batch.
+    #[getter]
+    fn hashes(&self) -> Vec<&str> {
+        self.column(&self.hashes)
+    }
+
+    /// Author names of all commits in the batch.
+    #[getter]
+    fn author_names(&self) -> Vec<&str> {
+        self.column(&self.author_names)
+    }
+
+    /// Author emails of all commits in the batch.
+    #[getter]
+    fn author_emails(&self) -> Vec<&str> {
+        self.column(&self.author_emails)
+    }
+
+    /// Subjects of all commits in the batch.
+    #[getter]
+    fn subjects(&self) -> Vec<&str> {
+        self.column(&self.subjects)
+    }
+
+    fn __repr__(&self) -> String {
+        format!("CommitBatch(len={})", self.len())
     }
 }
 
@@ -65,6 +276,7 @@ mod tests {
             author_name: "Test Author".to_string(),
             author_email: "test@example.com".to_string(),
             subject: subject.to_string(),
+            validate_cache: Default::default(),
         }
     }
 
@@ -88,4 +300,89 @@ mod tests {
         let commit = create_test_commit("a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2", "1234567890");
         assert!(commit.is_short(10));
     }
+
+    #[test]
+    fn batch_parses_log_output() {
+        let output = "abc123|John Doe|john@example.com|feat: add feature\n\
+                      def456|Jane Roe|jane@example.com|fix: handle a|b case"
+            .to_string();
+        let batch = CommitBatch::from_log_output(output);
+
+        assert_eq!(batch.len(), 2);
+        let first = batch.get(0).unwrap();
+        assert_eq!(first.hash, "abc123");
+        assert_eq!(first.author_name, "John Doe");
+        assert_eq!(first.author_email, "john@example.com");
+        assert_eq!(first.subject, "feat: add feature");
+        assert_eq!(batch.get(1).unwrap().subject, "fix: handle a|b case");
+        assert!(batch.get(2).is_none());
+    }
+
+    #[test]
+    fn batch_subject_reads_without_building_commit() {
+        let output = "abc123|A|a@x.com|first\ndef456|B|b@x.com|second".to_string();
+        let batch = CommitBatch::from_log_output(output);
+
+        assert_eq!(batch.subject(1), Some("second"));
+        assert_eq!(batch.subject(2), None);
+    }
+
+    #[test]
+    fn batch_columns_follow_commit_order() {
+        let output = "abc123|A|a@x.com|first\ndef456|B|b@x.com|second".to_string();
+        let batch = CommitBatch::from_log_output(output);
+
+        assert_eq!(batch.hashes(), vec!["abc123", "def456"]);
+        assert_eq!(batch.subjects(), vec!["first", "second"]);
+    }
+
+    #[test]
+    fn batch_skips_unparseable_lines() {
+        let output = "abc123|A|a@x.com|first\nnot a commit\n".to_string();
+        let batch = CommitBatch::from_log_output(output);
+
+        assert_eq!(batch.len(), 1);
+        assert_eq!(batch.iter().count(), 1);
+    }
+
+    #[test]
+    fn batch_from_empty_output_is_empty() {
+        let batch = CommitBatch::from_log_output(String::new());
+        assert!(batch.is_empty());
+    }
+
+    #[test]
+    fn validate_caches_results_per_config() {
+        let commit = create_test_commit("a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2", "fix bug");
+
+        let short = commit.validate(30, None);
+        let not_short = commit.validate(0, None);
+        assert!(short.contains(&Validation::ShortCommit));
+        assert!(!not_short.contains(&Validation::ShortCommit));
+
+        assert_eq!(commit.validate(30, None), short);
+        assert_eq!(commit.validate_cache.lock().unwrap().len(), 2);
+    }
+
+    #[test]
+    fn clone_starts_with_empty_validate_cache() {
+        let commit = create_test_commit("a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2", "fix bug");
+        commit.validate(30, None);
+
+        let cloned = commit.clone();
+        assert_eq!(cloned.subject, commit.subject);
+        assert!(cloned.validate_cache.lock().unwrap().is_empty());
+    }
+
+    #[test]
+    fn validate_cache_is_bounded() {
+        let commit = create_test_commit("a1b2c3d4e5f6a1b2c3d4e5f6a1b2c3d4e5f6a1b2", "fix bug");
+        for threshold in 0..VALIDATE_CACHE_SIZE * 2 {
+            commit.validate(threshold, None);
+        }
+        assert_eq!(
+            commit.validate_cache.lock().unwrap().len(),
+            VALIDATE_CACHE_SIZE
+        );
+    }
 }
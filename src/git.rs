@@ -5,15 +5,32 @@ use std::{
     process::Command,
 };
 
-use crate::commit::Commit;
+use crate::commit::{Commit, CommitBatch};
 use crate::error::CLIError;
 
 pub fn fetch_commits(
     repo_path: Option<&PathBuf>,
     limit: Option<usize>,
 ) -> Result<Vec<Commit>, CLIError> {
+    Ok(fetch_commit_batch(repo_path, limit)?.iter().collect())
+}
+
+pub fn fetch_commit_batch(
+    repo_path: Option<&PathBuf>,
+    limit: Option<usize>,
+) -> Result<CommitBatch, CLIError> {
+    // Nothing to walk, so skip spawning git entirely
+    if limit == Some(0) {
+        return Ok(CommitBatch::default());
+    }
+
+    // Only commit headers are read. Opt out of log.showSignature and
+    // log.decorate so user config cannot add per-commit GPG verification
+    // or ref loading (signature output would also break line parsing).
     let mut args = vec![
         "log".to_string(),
+        "--no-show-signature".to_string(),
+        "--no-decorate".to_string(),
         "--pretty=format:%H|%an|%ae|%s".to_string(),
     ];
 
@@ -34,29 +51,11 @@ pub fn fetch_commits(
         return Err(CLIError::GitCommandFailed(stderr.trim().to_string()));
     }
 
-    let log_output = String::from_utf8_lossy(&log_command.stdout);
-    let mut commits = Vec::new();
-
-    for line in log_output.lines() {
-        let parts: Vec<&str> = line.splitn(4, '|').collect();
+    // Reuse git's output buffer as-is unless it needs lossy UTF-8 repair
+    let log_output = String::from_utf8(log_command.stdout)
+        .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned());
 
-        match parts.as_slice() {
-            [hash, author_name, author_email, subject] => {
-                let commit = Commit {
-                    hash: hash.to_string(),
-                    author_name: author_name.to_string(),
-                    author_email: author_email.to_string(),
-                    subject: subject.to_string(),
-                };
-                commits.push(commit);
-            }
-            _ => {
-                eprintln!("Warning: Could not parse commit line");
-            }
-        }
-    }
-
-    Ok(commits)
+    Ok(CommitBatch::from_log_output(log_output))
 }
 
 pub fn count_commits(repo_path: Option<&PathBuf>) -> Result<usize, CLIError> {
@@ -80,6 +79,28 @@ pub fn count_commits(repo_path: Option<&PathBuf>) -> Result<usize, CLIError> {
         .map_err(|_| CLIError::GitCommandFailed("Failed to parse commit count".to_string()))
 }
 
+/// Write a commit-graph file with changed-path Bloom filters.
+///
+/// Speeds up later history walks (`git log`, `git rev-list --count`) and
+/// path-limited history queries. Writes into the repository's object directory.
+pub fn write_commit_graph(repo_path: Option<&PathBuf>) -> Result<(), CLIError> {
+    let mut command = Command::new("git");
+
+    if let Some(path) = repo_path {
+        command.current_dir(path);
+    }
+
+    let output = command
+        .args(["commit-graph", "write", "--reachable", "--changed-paths"])
+        .output()?;
+
+    if !output.status.success() {
+        let stderr = String::from_utf8_lossy(&output.stderr);
+        return Err(CLIError::GitCommandFailed(stderr.trim().to_string()));
+    }
+    Ok(())
+}
+
 pub fn validate_repo_path(path: &Path) -> Result<(), CLIError> {
     if !path.exists() {
         return Err(CLIError::PathNotFound(path.to_path_buf()));
@@ -108,6 +129,50 @@ mod tests {
         assert!(matches!(result, Err(CLIError::NotARepository(_))));
     }
 
+    #[test]
+    fn fetch_commits_with_zero_limit_returns_empty() {
+        let commits = fetch_commits(None, Some(0)).unwrap();
+        assert!(commits.is_empty());
+    }
+
+    #[test]
+    fn fetch_commits_respects_limit() {
+        let commits = fetch_commits(None, Some(1)).unwrap();
+        assert_eq!(commits.len(), 1);
+    }
+
+    fn git(dir: &Path, args: &[&str]) {
+        let status = Command::new("git")
+            .current_dir(dir)
+            .args(["-c", "user.name=Test", "-c", "user.email=test@example.com"])
+            .args(["-c", "commit.gpgsign=false"])
+            .args(args)
+            .status()
+            .unwrap();
+        assert!(status.success(), "git {:?} failed", args);
+    }
+
+    #[test]
+    fn write_commit_graph_creates_graph_file() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let repo_path = temp_dir.path().to_path_buf();
+        git(&repo_path, &["init", "-q"]);
+        git(&repo_path, &["commit", "-q", "--allow-empty", "-m", "init"]);
+
+        write_commit_graph(Some(&repo_path)).unwrap();
+
+        let graph = repo_path.join(".git/objects/info/commit-graph");
+        assert!(graph.exists());
+    }
+
+    #[test]
+    fn write_commit_graph_fails_outside_repository() {
+        let temp_dir = tempfile::tempdir().unwrap();
+        let repo_path = temp_dir.path().to_path_buf();
+        let result = write_commit_graph(Some(&repo_path));
+        assert!(matches!(result, Err(CLIError::GitCommandFailed(_))));
+    }
+
     #[test]
     fn succeeds_for_current_git_repo() {
         let path = PathBuf::from(".");
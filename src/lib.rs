@@ -6,6 +6,7 @@ mod config;
 pub mod error;
 mod git;
 mod output;
+mod repository;
 mod validation;
 
 use std::path::{Path, PathBuf};
@@ -13,12 +14,16 @@ use std::path::{Path, PathBuf};
 use clap::Parser;
 use config::{ConfigFile, find_config_file, load_config};
 use error::CLIError;
-use git::{count_commits, fetch_commits as git_fetch_commits, validate_repo_path};
-use output::print_results;
+use git::{
+    count_commits, fetch_commit_batch as git_fetch_commit_batch,
+    fetch_commits as git_fetch_commits, validate_repo_path,
+};
+use output::{print_acceptable, print_results};
 use pyo3::prelude::*;
+use repository::Repository;
 use validation::{Severity, ValidationConfig, validate_commits};
 
-pub use commit::Commit;
+pub use commit::{Commit, CommitBatch};
 pub use validation::Validation;
 
 #[derive(Parser, Debug)]
@@ -134,6 +139,11 @@ impl GitCLI {
     }
 
     pub fn run(&self) -> Result<(), CLIError> {
+        // Fail fast on a bad path before config discovery or any git call
+        if let Some(ref path) = self.path {
+            validate_repo_path(path)?;
+        }
+
         let mut config = ValidationConfig::default();
 
         // Load config file unless disabled
@@ -172,7 +182,7 @@ impl GitCLI {
             }
         }
 
-        commit_analyzer(
+        run_analysis(
             self.path.as_ref(),
             self.limit,
             self.quiet,
@@ -192,12 +202,30 @@ pub fn commit_analyzer(
     if let Some(p) = path {
         validate_repo_path(p)?;
     }
+    run_analysis(path, limit, quiet, strict, config)
+}
+
+/// Analyze commits in a repository whose path has already been validated.
+fn run_analysis(
+    path: Option<&PathBuf>,
+    limit: Option<usize>,
+    quiet: bool,
+    strict: bool,
+    config: &ValidationConfig,
+) -> Result<(), CLIError> {
+    // Nothing to analyze, so skip counting and fetching the history
+    if limit == Some(0) {
+        if !quiet {
+            print_acceptable();
+        }
+        return Ok(());
+    }
 
     let total_commits = count_commits(path)?;
-    let commits = git_fetch_commits(path, limit)?;
+    let batch = git_fetch_commit_batch(path, limit)?;
 
-    let validation_results = validate_commits(&commits, config);
-    let analyzed_count = commits.len();
+    let validation_results = validate_commits(&batch, config);
+    let analyzed_count = batch.len();
 
     let has_errors = validation_results.iter().any(|r| r.has_errors());
     let has_warnings = validation_results.iter().any(|r| r.has_warnings());
@@ -220,26 +248,102 @@ pub fn commit_analyzer(
     }
 }
 
+/// Where a Python API call runs: an explicit path or a repository handle.
+enum RepoTarget {
+    Path(Option<PathBuf>),
+    Handle(Repository),
+}
+
+impl RepoTarget {
+    fn path(&self) -> Option<&PathBuf> {
+        match self {
+            RepoTarget::Path(path) => path.as_ref(),
+            RepoTarget::Handle(repo) => Some(&repo.path),
+        }
+    }
+
+    /// Configuration file for this target, reusing the one a handle already discovered.
+    fn config_file(&self) -> Option<ConfigFile> {
+        match self {
+            RepoTarget::Path(path) => find_config_file(path.as_deref().unwrap_or(Path::new("."))),
+            RepoTarget::Handle(repo) => repo.config_file.clone(),
+        }
+    }
+}
+
+/// Resolve the target of a call from either a path or a repository handle.
+fn resolve_repo(path: Option<String>, repo: Option<Repository>) -> PyResult<RepoTarget> {
+    match (path, repo) {
+        (Some(_), Some(_)) => Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "Pass either path or repo, not both",
+        )),
+        (None, Some(repo)) => Ok(RepoTarget::Handle(repo)),
+        (path, None) => {
+            let path_buf = path.map(PathBuf::from);
+            // Fail fast on a bad path before config discovery or any git call
+            if let Some(ref p) = path_buf {
+                validate_repo_path(p).map_err(|e| {
+                    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string())
+                })?;
+            }
+            Ok(RepoTarget::Path(path_buf))
+        }
+    }
+}
+
 /// Fetch commits from a git repository.
 ///
 /// Args:
 ///     path: Path to the repository (default: current directory)
 ///     limit: Maximum number of commits to fetch (default: all)
+///     repo: Repository handle to use instead of path
 ///
 /// Returns:
 ///     List of Commit objects
 ///
 /// Raises:
+///     ValueError: If both path and repo are given
 ///     RuntimeError: If the path is invalid or git command fails
 #[pyfunction]
-#[pyo3(signature = (path=None, limit=None))]
-fn fetch_commits(path: Option<String>, limit: Option<usize>) -> PyResult<Vec<Commit>> {
-    let path_buf = path.map(PathBuf::from);
-    if let Some(ref p) = path_buf {
-        validate_repo_path(p)
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-    }
-    git_fetch_commits(path_buf.as_ref(), limit)
+#[pyo3(signature = (path=None, limit=None, repo=None))]
+fn fetch_commits(
+    py: Python<'_>,
+    path: Option<String>,
+    limit: Option<usize>,
+    repo: Option<Repository>,
+) -> PyResult<Vec<Commit>> {
+    let target = resolve_repo(path, repo)?;
+    py.detach(|| git_fetch_commits(target.path(), limit))
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+}
+
+/// Fetch commits from a git repository as a column-oriented batch.
+///
+/// Unlike fetch_commits, Commit objects are only created when items are
+/// accessed, and whole columns are available as lists.
+///
+/// Args:
+///     path: Path to the repository (default: current directory)
+///     limit: Maximum number of commits to fetch (default: all)
+///     repo: Repository handle to use instead of path
+///
+/// Returns:
+///     CommitBatch supporting len(), indexing, iteration and the
+///     hashes/author_names/author_emails/subjects columns
+///
+/// Raises:
+///     ValueError: If both path and repo are given
+///     RuntimeError: If the path is invalid or git command fails
+#[pyfunction]
+#[pyo3(signature = (path=None, limit=None, repo=None))]
+fn fetch_commit_batch(
+    py: Python<'_>,
+    path: Option<String>,
+    limit: Option<usize>,
+    repo: Option<Repository>,
+) -> PyResult<CommitBatch> {
+    let target = resolve_repo(path, repo)?;
+    py.detach(|| git_fetch_commit_batch(target.path(), limit))
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
 }
 
@@ -254,32 +358,38 @@ fn fetch_commits(path: Option<String>, limit: Option<usize>) -> PyResult<Vec<Com
 ///             If None and use_config=True, auto-discovers pyproject.toml.
 ///     use_config: Whether to auto-load configuration from pyproject.toml (default: True).
 ///                 Ignored if config is provided.
+///     repo: Repository handle to use instead of path. Its path and discovered
+///           configuration file are reused rather than looked up again.
 ///
 /// Returns:
 ///     None on success
 ///
 /// Raises:
+///     ValueError: If both path and repo are given
 ///     RuntimeError: If validation issues are found or other errors occur
 #[pyfunction]
-#[pyo3(signature = (path=None, limit=None, quiet=false, strict=false, config=None, use_config=true))]
+#[pyo3(signature = (path=None, limit=None, quiet=false, strict=false, config=None, use_config=true, repo=None))]
+#[allow(clippy::too_many_arguments)]
 fn analyze_commits(
+    py: Python<'_>,
     path: Option<String>,
     limit: Option<usize>,
     quiet: bool,
     strict: bool,
     config: Option<ValidationConfig>,
     use_config: bool,
+    repo: Option<Repository>,
 ) -> PyResult<()> {
-    let path_buf = path.map(PathBuf::from);
+    let target = resolve_repo(path, repo)?;
 
     let validation_config = if let Some(cfg) = config {
         cfg
     } else if use_config {
-        // Auto-discover and load config
-        let start_dir = path_buf.as_deref().unwrap_or(Path::new("."));
+        // Auto-discover and load config, unless the repository handle already did
+        let config_file = target.config_file();
 
         let mut cfg = ValidationConfig::default();
-        if let Some(config_file) = find_config_file(start_dir) {
+        if let Some(config_file) = config_file {
             let file_config = load_config(&config_file)
                 .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
             cfg.apply_file_config(&file_config)
@@ -290,27 +400,28 @@ fn analyze_commits(
         ValidationConfig::default()
     };
 
-    // Check if we should run based on branch filter
-    if !validation_config.branches.is_empty() {
-        let current_branch = branch::get_current_branch(path_buf.as_ref())
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-
-        match current_branch {
-            Some(branch_name) => {
-                if !branch::matches_any_pattern(&branch_name, &validation_config.branches) {
-                    // Branch doesn't match - skip validation silently
+    // git runs and validation happen entirely in Rust, so other Python threads
+    // can proceed while they do
+    py.detach(|| {
+        // Check if we should run based on branch filter
+        if !validation_config.branches.is_empty() {
+            match branch::get_current_branch(target.path())? {
+                Some(branch_name) => {
+                    if !branch::matches_any_pattern(&branch_name, &validation_config.branches) {
+                        // Branch doesn't match - skip validation silently
+                        return Ok(());
+                    }
+                }
+                None => {
+                    // Detached HEAD state - skip validation
                     return Ok(());
                 }
             }
-            None => {
-                // Detached HEAD state - skip validation
-                return Ok(());
-            }
         }
-    }
 
-    commit_analyzer(path_buf.as_ref(), limit, quiet, strict, &validation_config)
-        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+        run_analysis(target.path(), limit, quiet, strict, &validation_config)
+    })
+    .map_err(|e: CLIError| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
 }
 
 /// CLI entry point. Exits with code 1 if validation issues are found.
@@ -345,10 +456,16 @@ mod mixed_pickles {
     #[pymodule_export]
     use super::commit::Commit;
     #[pymodule_export]
+    use super::commit::CommitBatch;
+    #[pymodule_export]
+    use super::fetch_commit_batch;
+    #[pymodule_export]
     use super::fetch_commits;
     #[pymodule_export]
     use super::main;
     #[pymodule_export]
+    use super::repository::Repository;
+    #[pymodule_export]
     use super::validation::Severity;
     #[pymodule_export]
     use super::validation::Validation;
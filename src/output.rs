@@ -39,6 +39,11 @@ fn pluralize(count: usize, singular: &str, plural: &str) -> String {
     }
 }
 
+/// Report that no commit needs attention, e.g. when none were analyzed.
+pub fn print_acceptable() {
+    println!("Commit messages are adequately executed.");
+}
+
 pub fn print_results(
     validation_results: &[ValidationResult],
     total_commits: usize,
@@ -53,7 +58,7 @@ pub fn print_results(
             println!("No commits found in repository.");
         }
         CommitMessageStatus::Acceptable => {
-            println!("Commit messages are adequately executed.");
+            print_acceptable();
         }
         CommitMessageStatus::NeedsWork => {
             let path_display = path
@@ -123,6 +128,7 @@ mod tests {
             author_name: "Author".to_string(),
             author_email: "a@b.com".to_string(),
             subject: subject.to_string(),
+            validate_cache: Default::default(),
         }
     }
 
@@ -142,9 +148,8 @@ mod tests {
 
     #[test]
     fn needs_work_when_validation_failures_exist() {
-        let commit = create_test_commit("fix");
         let results = vec![ValidationResult {
-            commit: &commit,
+            commit: create_test_commit("fix"),
             findings: vec![Finding::new(Validation::ShortCommit, Severity::Warning)],
         }];
         let status = CommitMessageStatus::from_validation_results(&results, 10);
@@ -0,0 +1,107 @@
+//! Reusable repository handle for the Python API.
+
+use std::path::PathBuf;
+
+use pyo3::prelude::*;
+
+use crate::config::{ConfigFile, find_config_file};
+use crate::error::CLIError;
+use crate::git::{validate_repo_path, write_commit_graph};
+
+/// A validated git repository that can be shared across calls.
+///
+/// Path validation, resolution to an absolute path and configuration file
+/// discovery happen once when the handle is created instead of on every `fetch_commits`/`analyze_commits` call.
+#[pyclass]
+#[derive(Debug, Clone)]
+pub struct Repository {
+    pub(crate) path: PathBuf,
+    pub(crate) config_file: Option<ConfigFile>,
+}
+
+impl Repository {
+    pub fn open(path: PathBuf) -> Result<Self, CLIError> {
+        validate_repo_path(&path)?;
+        // Resolve now so a later working-directory change cannot point git
+        // at a different repository than the cached config file belongs to
+        let path = std::fs::canonicalize(&path)?;
+        let config_file = find_config_file(&path);
+        Ok(Self { path, config_file })
+    }
+}
+
+#[pymethods]
+impl Repository {
+    /// Open a git repository.
+    ///
+    /// Args:
+    ///     path: Path to the repository (default: current directory)
+    ///
+    /// Raises:
+    ///     RuntimeError: If the path does not exist or is not a git repository
+    #[new]
+    #[pyo3(signature = (path=None))]
+    fn py_new(path: Option<String>) -> PyResult<Self> {
+        let path_buf = PathBuf::from(path.unwrap_or_else(|| ".".to_string()));
+        Self::open(path_buf)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+    }
+
+    /// Write a commit-graph file with changed-path Bloom filters.
+    ///
+    /// Speeds up subsequent history walks on large repositories. This
+    /// modifies the repository's object directory, so it is never done
+    /// implicitly.
+    ///
+    /// Raises:
+    ///     RuntimeError: If the git command fails
+    fn write_commit_graph(&self) -> PyResult<()> {
+        write_commit_graph(Some(&self.path))
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))
+    }
+
+    #[getter]
+    fn path(&self) -> String {
+        self.path.display().to_string()
+    }
+
+    fn __repr__(&self) -> String {
+        format!("Repository(path={:?})", self.path.display().to_string())
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn open_succeeds_for_current_git_repo() {
+        let repo = Repository::open(PathBuf::from("."));
+        assert!(repo.is_ok());
+    }
+
+    #[test]
+    fn open_resolves_absolute_path() {
+        let repo = Repository::open(PathBuf::from(".")).unwrap();
+        assert!(repo.path.is_absolute());
+        assert_eq!(repo.path, std::fs::canonicalize(".").unwrap());
+    }
+
+    #[test]
+    fn open_discovers_config_file() {
+        let repo = Repository::open(PathBuf::from(".")).unwrap();
+        assert!(repo.config_file.is_some());
+    }
+
+    #[test]
+    fn open_returns_error_for_nonexistent_path() {
+        let result = Repository::open(PathBuf::from("/this/path/does/not/exist"));
+        assert!(matches!(result, Err(CLIError::PathNotFound(_))));
+    }
+
+    #[test]
+    fn open_returns_error_for_non_git_directory() {
+        let result = Repository::open(PathBuf::from("/tmp"));
+        assert!(matches!(result, Err(CLIError::NotARepository(_))));
+    }
+}
@@ -2,40 +2,62 @@
 
 use std::collections::HashMap;
 use std::fmt;
+use std::ops::Range;
 use std::str::FromStr;
 use std::sync::LazyLock;
 
+use pyo3::intern;
 use pyo3::prelude::*;
-use regex::Regex;
+use pyo3::types::PyString;
+use regex::{Regex, RegexSet, SetMatches};
 
 use crate::config::{ConfigError, SeverityConfig, ToolConfig};
 
-static REFERENCE_REGEX: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"(?i)(#\d+|gh-\d+|[A-Z]{2,}-\d+)").expect("Invalid reference regex")
-});
+// Patterns avoid leading `.*` and anchor with `^` where a check is about the
+// start of the subject. Word boundaries stay Unicode-aware so letters such as
+// `é` still count as part of a word.
 
-static CONVENTIONAL_COMMIT_REGEX: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"^(feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(\(.+\))?!?:\s.+")
-        .expect("Invalid conventional commit regex")
-});
+const REFERENCE_PATTERN: &str = r"(?i-u)#\d+|gh-\d+|[A-Z]{2,}-\d+";
 
-static VAGUE_LANGUAGE_REGEX: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"(?i)\b(fix(ed|es|ing)?|update[ds]?|change[ds]?|modify|modified|modifies|tweak(ed|s)?|adjust(ed|s)?)\s+(it|this|that|things?|stuff|code|bug|issue|error|problem)s?\b")
-        .expect("Invalid vague language regex")
-});
+const CONVENTIONAL_COMMIT_PATTERN: &str =
+    r"^(?:feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(?:\([^)]+\))?!?:\s.";
 
-static WIP_COMMIT_REGEX: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"(?i)(^wip\b|^wip:|^\[wip\]|\bwork.?in.?progress\b|^fixup!|^squash!|^amend!|\bdo\s*not\s*merge\b|\bdon'?t\s*merge\b|\bwip\s*$)")
-        .expect("Invalid WIP commit regex")
-});
+const VAGUE_LANGUAGE_PATTERN: &str = r"(?i)\b(?:fix(?:ed|es|ing)?|update[ds]?|change[ds]?|modify|modified|modifies|tweak(?:ed|s)?|adjust(?:ed|s)?)\s+(?:it|this|that|things?|stuff|code|bug|issue|error|problem)s?\b";
+
+const WIP_COMMIT_PATTERN: &str = r"(?i)^(?:wip\b|\[wip\]|fixup!|squash!|amend!)|\b(?:work.?in.?progress|do\s*not\s*merge|don'?t\s*merge)\b|\bwip\s*$";
+
+const NON_IMPERATIVE_PATTERN: &str = r"(?i)^(?:(?:feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(?:\([^)]+\))?!?:\s*)?(added|removed|fixed|updated|changed|implemented|created|deleted|modified|refactored|improved|resolved|merged|moved|renamed|replaced|cleaned|enabled|disabled|converted|introduced|integrated|adjusted|corrected|enhanced|extended|optimized|simplified|upgraded|migrated|adding|removing|fixing|updating|changing|implementing|creating|deleting|modifying|refactoring|improving|resolving|merging|moving|renaming|replacing|cleaning|enabling|disabling|converting|introducing|integrating|adjusting|correcting|enhancing|extending|optimizing|simplifying|upgrading|migrating)\b";
 
-static NON_IMPERATIVE_REGEX: LazyLock<Regex> = LazyLock::new(|| {
-    Regex::new(r"(?i)^(?:(?:feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(?:\([^)]+\))?!?:\s*)?(added|removed|fixed|updated|changed|implemented|created|deleted|modified|refactored|improved|resolved|merged|moved|renamed|replaced|cleaned|enabled|disabled|converted|introduced|integrated|adjusted|corrected|enhanced|extended|optimized|simplified|upgraded|migrated|adding|removing|fixing|updating|changing|implementing|creating|deleting|modifying|refactoring|improving|resolving|merging|moving|renaming|replacing|cleaning|enabling|disabling|converting|introducing|integrating|adjusting|correcting|enhancing|extending|optimizing|simplifying|upgrading|migrating)\b")
-        .expect("Invalid non-imperative regex")
+static VAGUE_LANGUAGE_REGEX: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(VAGUE_LANGUAGE_PATTERN).expect("Invalid vague language regex"));
+
+static NON_IMPERATIVE_REGEX: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(NON_IMPERATIVE_PATTERN).expect("Invalid non-imperative regex"));
+
+const REFERENCE_INDEX: usize = 0;
+const CONVENTIONAL_COMMIT_INDEX: usize = 1;
+const VAGUE_LANGUAGE_INDEX: usize = 2;
+const WIP_COMMIT_INDEX: usize = 3;
+const NON_IMPERATIVE_INDEX: usize = 4;
+
+/// All subject patterns, so `validate_commit` scans each subject once
+/// instead of once per check. Ordered by the `*_INDEX` constants.
+static SUBJECT_PATTERNS: LazyLock<RegexSet> = LazyLock::new(|| {
+    RegexSet::new([
+        REFERENCE_PATTERN,
+        CONVENTIONAL_COMMIT_PATTERN,
+        VAGUE_LANGUAGE_PATTERN,
+        WIP_COMMIT_PATTERN,
+        NON_IMPERATIVE_PATTERN,
+    ])
+    .expect("Invalid subject pattern set")
 });
 
 /// Validation types for commit analysis.
-#[pyclass(eq, eq_int)]
+///
+/// Frozen so Python can share each variant without borrow checks, and
+/// hashable so variants can be used as dict keys or in sets.
+#[pyclass(eq, eq_int, hash, frozen)]
 #[derive(Debug, Clone, PartialEq, Eq, Hash)]
 pub enum Validation {
     /// Commit message is too short.
@@ -124,7 +146,7 @@ impl FromStr for Validation {
 }
 
 /// Severity level for validation findings.
-#[pyclass(eq, eq_int)]
+#[pyclass(eq, eq_int, hash, frozen)]
 #[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
 pub enum Severity {
     Error,
@@ -147,24 +169,28 @@ impl FromStr for Severity {
     }
 }
 
+// `__str__`/`__repr__` return interned Python strings, created once per
+// variant, so repeated calls do not allocate a new str each time.
 #[pymethods]
 impl Severity {
-    fn __str__(&self) -> &'static str {
+    fn __str__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match self {
-            Severity::Error => "error",
-            Severity::Warning => "warning",
-            Severity::Info => "info",
-            Severity::Ignore => "ignore",
+            Severity::Error => intern!(py, "error"),
+            Severity::Warning => intern!(py, "warning"),
+            Severity::Info => intern!(py, "info"),
+            Severity::Ignore => intern!(py, "ignore"),
         }
+        .clone()
     }
 
-    fn __repr__(&self) -> String {
+    fn __repr__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match self {
-            Severity::Error => "Severity.Error".to_string(),
-            Severity::Warning => "Severity.Warning".to_string(),
-            Severity::Info => "Severity.Info".to_string(),
-            Severity::Ignore => "Severity.Ignore".to_string(),
+            Severity::Error => intern!(py, "Severity.Error"),
+            Severity::Warning => intern!(py, "Severity.Warning"),
+            Severity::Info => intern!(py, "Severity.Info"),
+            Severity::Ignore => intern!(py, "Severity.Ignore"),
         }
+        .clone()
     }
 }
 
@@ -217,6 +243,17 @@ pub struct ValidationConfig {
     pub branches: Vec<String>,
 }
 
+/// The settings of a `ValidationConfig` that affect per-commit results.
+///
+/// Branch filters are left out since they decide whether validation runs,
+/// not what it finds.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub struct ConfigKey {
+    threshold: usize,
+    checks: [bool; 6],
+    severities: [Severity; 6],
+}
+
 impl Default for ValidationConfig {
     fn default() -> Self {
         let mut severities = HashMap::new();
@@ -307,6 +344,30 @@ impl ValidationConfig {
             .unwrap_or(Severity::Warning)
     }
 
+    /// Key identifying every setting that can change validation results.
+    pub fn cache_key(&self) -> ConfigKey {
+        ConfigKey {
+            threshold: self.threshold,
+            checks: [
+                self.check_short,
+                self.require_issue_ref,
+                self.require_conventional_format,
+                self.check_vague_language,
+                self.check_wip,
+                self.check_imperative,
+            ],
+            severities: [
+                Validation::ShortCommit,
+                Validation::MissingReference,
+                Validation::InvalidFormat,
+                Validation::VagueLanguage,
+                Validation::WipCommit,
+                Validation::NonImperative,
+            ]
+            .map(|validation| self.get_severity(&validation)),
+        }
+    }
+
     pub fn should_report(&self, validation: &Validation) -> bool {
         self.get_severity(validation) != Severity::Ignore
     }
@@ -557,26 +618,36 @@ impl ValidationConfig {
 #[pymethods]
 impl Validation {
     /// Human-readable description of this validation type.
-    fn __str__(&self) -> &'static str {
+    fn __str__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match self {
-            Validation::ShortCommit => "Short commit message",
-            Validation::MissingReference => "Missing issue reference (e.g., #123)",
-            Validation::InvalidFormat => "Invalid format (expected: type: description)",
-            Validation::VagueLanguage => "Vague language (e.g., 'fix bug', 'update code')",
-            Validation::WipCommit => "Work-in-progress commit (e.g., 'WIP', 'fixup!')",
-            Validation::NonImperative => "Non-imperative mood (use 'Add' not 'Added')",
+            Validation::ShortCommit => intern!(py, "Short commit message"),
+            Validation::MissingReference => intern!(py, "Missing issue reference (e.g., #123)"),
+            Validation::InvalidFormat => {
+                intern!(py, "Invalid format (expected: type: description)")
+            }
+            Validation::VagueLanguage => {
+                intern!(py, "Vague language (e.g., 'fix bug', 'update code')")
+            }
+            Validation::WipCommit => {
+                intern!(py, "Work-in-progress commit (e.g., 'WIP', 'fixup!')")
+            }
+            Validation::NonImperative => {
+                intern!(py, "Non-imperative mood (use 'Add' not 'Added')")
+            }
         }
+        .clone()
     }
 
-    fn __repr__(&self) -> String {
+    fn __repr__<'py>(&self, py: Python<'py>) -> Bound<'py, PyString> {
         match self {
-            Validation::ShortCommit => "Validation.ShortCommit".to_string(),
-            Validation::MissingReference => "Validation.MissingReference".to_string(),
-            Validation::InvalidFormat => "Validation.InvalidFormat".to_string(),
-            Validation::VagueLanguage => "Validation.VagueLanguage".to_string(),
-            Validation::WipCommit => "Validation.WipCommit".to_string(),
-            Validation::NonImperative => "Validation.NonImperative".to_string(),
+            Validation::ShortCommit => intern!(py, "Validation.ShortCommit"),
+            Validation::MissingReference => intern!(py, "Validation.MissingReference"),
+            Validation::InvalidFormat => intern!(py, "Validation.InvalidFormat"),
+            Validation::VagueLanguage => intern!(py, "Validation.VagueLanguage"),
+            Validation::WipCommit => intern!(py, "Validation.WipCommit"),
+            Validation::NonImperative => intern!(py, "Validation.NonImperative"),
         }
+        .clone()
     }
 }
 
@@ -599,22 +670,10 @@ impl fmt::Display for Validation {
     }
 }
 
-pub fn has_reference(subject: &str) -> bool {
-    REFERENCE_REGEX.is_match(subject)
-}
-
-pub fn has_conventional_format(subject: &str) -> bool {
-    CONVENTIONAL_COMMIT_REGEX.is_match(subject)
-}
-
 pub fn find_vague_language(subject: &str) -> Option<&str> {
     VAGUE_LANGUAGE_REGEX.find(subject).map(|m| m.as_str())
 }
 
-pub fn is_wip_commit(subject: &str) -> bool {
-    WIP_COMMIT_REGEX.is_match(subject)
-}
-
 pub fn find_non_imperative(subject: &str) -> Option<&str> {
     NON_IMPERATIVE_REGEX
         .captures(subject)
@@ -635,8 +694,8 @@ fn check_short(subject: &str, config: &ValidationConfig) -> Option<Finding> {
     None
 }
 
-fn check_issue_reference(subject: &str, config: &ValidationConfig) -> Option<Finding> {
-    if !has_reference(subject) {
+fn check_issue_reference(matches: &SetMatches, config: &ValidationConfig) -> Option<Finding> {
+    if !matches.matched(REFERENCE_INDEX) {
         let severity = config.get_severity(&Validation::MissingReference);
         if severity != Severity::Ignore {
             return Some(Finding::new(Validation::MissingReference, severity));
@@ -700,8 +759,8 @@ fn suggest_commit_type(subject: &str) -> &'static str {
     "feat"
 }
 
-fn check_conventional_format(subject: &str, config: &ValidationConfig) -> Option<Finding> {
-    if !has_conventional_format(subject) {
+fn check_conventional_format(matches: &SetMatches, config: &ValidationConfig) -> Option<Finding> {
+    if !matches.matched(CONVENTIONAL_COMMIT_INDEX) {
         let severity = config.get_severity(&Validation::InvalidFormat);
         if severity != Severity::Ignore {
             return Some(Finding::new(Validation::InvalidFormat, severity));
@@ -710,8 +769,8 @@ fn check_conventional_format(subject: &str, config: &ValidationConfig) -> Option
     None
 }
 
-fn check_vague(subject: &str, config: &ValidationConfig) -> Option<Finding> {
-    if find_vague_language(subject).is_some() {
+fn check_vague(matches: &SetMatches, config: &ValidationConfig) -> Option<Finding> {
+    if matches.matched(VAGUE_LANGUAGE_INDEX) {
         let severity = config.get_severity(&Validation::VagueLanguage);
         if severity != Severity::Ignore {
             return Some(Finding::new(Validation::VagueLanguage, severity));
@@ -741,8 +800,8 @@ fn get_wip_suggestion(subject: &str) -> String {
     "Finalize before merging: git commit --amend".to_string()
 }
 
-fn check_wip(subject: &str, config: &ValidationConfig) -> Option<Finding> {
-    if is_wip_commit(subject) {
+fn check_wip(matches: &SetMatches, config: &ValidationConfig) -> Option<Finding> {
+    if matches.matched(WIP_COMMIT_INDEX) {
         let severity = config.get_severity(&Validation::WipCommit);
         if severity != Severity::Ignore {
             return Some(Finding::new(Validation::WipCommit, severity));
@@ -824,8 +883,8 @@ fn to_imperative(word: &str) -> String {
         .unwrap_or_else(|| word.to_string())
 }
 
-fn check_imperative(subject: &str, config: &ValidationConfig) -> Option<Finding> {
-    if find_non_imperative(subject).is_some() {
+fn check_imperative(matches: &SetMatches, config: &ValidationConfig) -> Option<Finding> {
+    if matches.matched(NON_IMPERATIVE_INDEX) {
         let severity = config.get_severity(&Validation::NonImperative);
         if severity != Severity::Ignore {
             return Some(Finding::new(Validation::NonImperative, severity));
@@ -834,7 +893,7 @@ fn check_imperative(subject: &str, config: &ValidationConfig) -> Option<Finding>
     None
 }
 
-use crate::commit::Commit;
+use crate::commit::{Commit, CommitBatch};
 
 /// Validate a commit against enabled checks.
 ///
@@ -842,11 +901,18 @@ use crate::commit::Commit;
 /// - WIP suppresses ShortCommit and VagueLanguage
 /// - ShortCommit suppresses NonImperative
 pub fn validate_commit(commit: &Commit, config: &ValidationConfig) -> Vec<Finding> {
+    validate_subject(&commit.subject, config)
+}
+
+/// Validate a commit subject against enabled checks.
+///
+/// Same rules as `validate_commit`, for callers that have not built a `Commit`.
+pub fn validate_subject(subject: &str, config: &ValidationConfig) -> Vec<Finding> {
     let mut findings = Vec::new();
-    let subject = &commit.subject;
+    let matches = SUBJECT_PATTERNS.matches(subject);
 
-    let is_wip = config.check_wip && is_wip_commit(subject);
-    if is_wip && let Some(f) = check_wip(subject, config) {
+    let is_wip = config.check_wip && matches.matched(WIP_COMMIT_INDEX);
+    if is_wip && let Some(f) = check_wip(&matches, config) {
         findings.push(f);
     }
 
@@ -856,27 +922,27 @@ pub fn validate_commit(commit: &Commit, config: &ValidationConfig) -> Vec<Findin
             findings.push(f);
         }
         if config.check_vague_language
-            && let Some(f) = check_vague(subject, config)
+            && let Some(f) = check_vague(&matches, config)
         {
             findings.push(f);
         }
     }
 
     if config.require_issue_ref
-        && let Some(f) = check_issue_reference(subject, config)
+        && let Some(f) = check_issue_reference(&matches, config)
     {
         findings.push(f);
     }
 
     if config.require_conventional_format
-        && let Some(f) = check_conventional_format(subject, config)
+        && let Some(f) = check_conventional_format(&matches, config)
     {
         findings.push(f);
     }
 
     if config.check_imperative
         && !is_short
-        && let Some(f) = check_imperative(subject, config)
+        && let Some(f) = check_imperative(&matches, config)
     {
         findings.push(f);
     }
@@ -886,12 +952,12 @@ pub fn validate_commit(commit: &Commit, config: &ValidationConfig) -> Vec<Findin
 
 /// A commit paired with its validation findings.
 #[derive(Debug)]
-pub struct ValidationResult<'a> {
-    pub commit: &'a Commit,
+pub struct ValidationResult {
+    pub commit: Commit,
     pub findings: Vec<Finding>,
 }
 
-impl<'a> ValidationResult<'a> {
+impl ValidationResult {
     pub fn has_errors(&self) -> bool {
         self.findings.iter().any(|f| f.severity == Severity::Error)
     }
@@ -903,17 +969,58 @@ impl<'a> ValidationResult<'a> {
     }
 }
 
-pub fn validate_commits<'a>(
-    commits: &'a [Commit],
+/// Below this many commits per thread, spawning workers costs more than it saves.
+const PARALLEL_THRESHOLD: usize = 64;
+
+/// Validate a batch of commits, splitting large histories across threads.
+///
+/// Subjects are checked straight from the batch; a `Commit` is only built for
+/// commits with findings. Results keep the order of the batch.
+pub fn validate_commits(batch: &CommitBatch, config: &ValidationConfig) -> Vec<ValidationResult> {
+    // Give every thread at least PARALLEL_THRESHOLD commits
+    let workers = std::thread::available_parallelism()
+        .map_or(1, |n| n.get())
+        .min(batch.len() / PARALLEL_THRESHOLD);
+    if workers <= 1 {
+        return validate_range(batch, 0..batch.len(), config);
+    }
+
+    let chunk_size = batch.len().div_ceil(workers);
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..batch.len())
+            .step_by(chunk_size)
+            .map(|start| {
+                let range = start..(start + chunk_size).min(batch.len());
+                scope.spawn(move || validate_range(batch, range, config))
+            })
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| {
+                handle
+                    .join()
+                    .unwrap_or_else(|payload| std::panic::resume_unwind(payload))
+            })
+            .collect()
+    })
+}
+
+fn validate_range(
+    batch: &CommitBatch,
+    range: Range<usize>,
     config: &ValidationConfig,
-) -> Vec<ValidationResult<'a>> {
-    commits
-        .iter()
-        .map(|commit| ValidationResult {
-            commit,
-            findings: validate_commit(commit, config),
+) -> Vec<ValidationResult> {
+    range
+        .filter_map(|index| {
+            let findings = validate_subject(batch.subject(index)?, config);
+            if findings.is_empty() {
+                return None;
+            }
+            Some(ValidationResult {
+                commit: batch.get(index)?,
+                findings,
+            })
         })
-        .filter(|result| !result.findings.is_empty())
         .collect()
 }
 
@@ -921,6 +1028,20 @@ pub fn validate_commits<'a>(
 mod tests {
     use super::*;
 
+    fn has_reference(subject: &str) -> bool {
+        SUBJECT_PATTERNS.matches(subject).matched(REFERENCE_INDEX)
+    }
+
+    fn has_conventional_format(subject: &str) -> bool {
+        SUBJECT_PATTERNS
+            .matches(subject)
+            .matched(CONVENTIONAL_COMMIT_INDEX)
+    }
+
+    fn is_wip_commit(subject: &str) -> bool {
+        SUBJECT_PATTERNS.matches(subject).matched(WIP_COMMIT_INDEX)
+    }
+
     mod reference_validation {
         use super::*;
 
@@ -956,6 +1077,13 @@ mod tests {
             assert!(!has_reference("fix: resolve bug #"));
             assert!(!has_reference("fix: resolve bug A-123")); // single letter prefix
         }
+
+        #[test]
+        fn matches_reference_inside_word() {
+            assert!(has_reference("fix: PROJ_ABC-12 thing"));
+            assert!(has_reference("see 1ABC-23"));
+            assert!(has_reference("bump v2JIRA-3"));
+        }
     }
 
     mod conventional_format_validation {
@@ -1028,6 +1156,13 @@ mod tests {
             assert!(!has_conventional_format("feat: "));
             assert!(!has_conventional_format("fix:"));
         }
+
+        #[test]
+        fn rejects_scope_spanning_parentheses() {
+            assert!(!has_conventional_format(
+                "feat(api) and fix(ui): add endpoint"
+            ));
+        }
     }
 
     mod vague_language_validation {
@@ -1171,6 +1306,13 @@ mod tests {
             assert!(!is_wip_commit("feat: add wiping functionality"));
             assert!(!is_wip_commit("fix: handle equipped items"));
         }
+
+        #[test]
+        fn allows_wip_after_non_ascii_letter() {
+            assert!(!is_wip_commit("éwip"));
+            assert!(!is_wip_commit("ÄWork in progress"));
+            assert!(!is_wip_commit("add new feature déwip"));
+        }
     }
 
     mod non_imperative_validation {
@@ -1258,17 +1400,53 @@ mod tests {
         }
     }
 
-    mod validate_commits_tests {
+    mod subject_patterns {
         use super::*;
 
-        fn create_valid_commit(subject: &str) -> Commit {
-            Commit {
-                hash: "1111111111111111111111111111111111111111".to_string(),
-                author_name: "Author".to_string(),
-                author_email: "a@b.com".to_string(),
-                subject: subject.to_string(),
+        #[test]
+        fn set_agrees_with_capturing_regexes() {
+            let subjects = [
+                "fix bug",
+                "update code in parser",
+                "feat: add OAuth2 login #42",
+                "Added new feature",
+                "fix: Fixed the login flow",
+                "refactoring the cache layer",
+                "docs: describe installation",
+            ];
+            for subject in subjects {
+                let matches = SUBJECT_PATTERNS.matches(subject);
+                assert_eq!(
+                    matches.matched(VAGUE_LANGUAGE_INDEX),
+                    find_vague_language(subject).is_some(),
+                    "vague language mismatch for {:?}",
+                    subject
+                );
+                assert_eq!(
+                    matches.matched(NON_IMPERATIVE_INDEX),
+                    find_non_imperative(subject).is_some(),
+                    "non-imperative mismatch for {:?}",
+                    subject
+                );
             }
         }
+    }
+
+    mod validate_commits_tests {
+        use super::*;
+
+        fn create_batch(subjects: &[&str]) -> CommitBatch {
+            let output: Vec<String> = subjects
+                .iter()
+                .map(|subject| {
+                    format!(
+                        "1111111111111111111111111111111111111111|Author|a@b.com|{}",
+                        subject
+                    )
+                })
+                .collect();
+            CommitBatch::from_log_output(output.join("\n"))
+        }
 
         fn config_with_threshold(threshold: usize) -> ValidationConfig {
             ValidationConfig::with_threshold(threshold)
@@ -1278,48 +1456,81 @@ mod tests {
             result.findings.iter().any(|f| f.validation == validation)
         }
 
+        #[test]
+        fn large_history_keeps_commit_order() {
+            let subjects: Vec<String> = (0..PARALLEL_THRESHOLD * 4)
+                .map(|i| {
+                    if i % 3 == 0 {
+                        format!("wip {}", i)
+                    } else {
+                        format!("feat: add feature number {} #{}", i, i)
+                    }
+                })
+                .collect();
+            let subjects: Vec<&str> = subjects.iter().map(String::as_str).collect();
+            let batch = create_batch(&subjects);
+            let config = config_with_threshold(10);
+
+            let results = validate_commits(&batch, &config);
+            let sequential = validate_range(&batch, 0..batch.len(), &config);
+
+            assert_eq!(results.len(), sequential.len());
+            for (parallel, expected) in results.iter().zip(&sequential) {
+                assert_eq!(parallel.commit.subject, expected.commit.subject);
+                assert_eq!(parallel.findings, expected.findings);
+            }
+        }
+
         #[test]
         fn valid_commit_passes_all_validations() {
-            let commits = vec![create_valid_commit(
-                "feat: add new feature for user authentication #123",
-            )];
+            let batch = create_batch(&["feat: add new feature for user authentication #123"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert!(results.is_empty(), "Expected no failures for valid commit");
         }
 
+        #[test]
+        fn failing_commit_keeps_its_metadata() {
+            let batch = create_batch(&["bad"]);
+            let config = config_with_threshold(10);
+            let results = validate_commits(&batch, &config);
+            assert_eq!(results.len(), 1);
+            assert_eq!(results[0].commit.subject, "bad");
+            assert_eq!(results[0].commit.author_email, "a@b.com");
+        }
+
         #[test]
         fn commit_missing_reference_fails() {
-            let commits = vec![create_valid_commit("feat: add new feature")];
+            let batch = create_batch(&["feat: add new feature"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::MissingReference));
         }
 
         #[test]
         fn commit_with_invalid_format_fails() {
-            let commits = vec![create_valid_commit("add new feature #123")];
+            let batch = create_batch(&["add new feature #123"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::InvalidFormat));
         }
 
         #[test]
         fn short_commit_fails() {
-            let commits = vec![create_valid_commit("feat: x #1")];
+            let batch = create_batch(&["feat: x #1"]);
             let config = config_with_threshold(20);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::ShortCommit));
         }
 
         #[test]
         fn commit_can_have_multiple_failures() {
-            let commits = vec![create_valid_commit("bad")];
+            let batch = create_batch(&["bad"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::ShortCommit));
             assert!(has_validation(&results[0], Validation::MissingReference));
@@ -1328,29 +1539,27 @@ mod tests {
 
         #[test]
         fn commit_with_vague_language_fails() {
-            let commits = vec![create_valid_commit("feat: fix bug #123")];
+            let batch = create_batch(&["feat: fix bug #123"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::VagueLanguage));
         }
 
         #[test]
         fn wip_commit_fails() {
-            let commits = vec![create_valid_commit(
-                "WIP: feat: add user authentication #123",
-            )];
+            let batch = create_batch(&["WIP: feat: add user authentication #123"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::WipCommit));
         }
 
         #[test]
         fn non_imperative_commit_fails() {
-            let commits = vec![create_valid_commit("feat: Added user authentication #123")];
+            let batch = create_batch(&["feat: Added user authentication #123"]);
             let config = config_with_threshold(10);
-            let results = validate_commits(&commits, &config);
+            let results = validate_commits(&batch, &config);
             assert_eq!(results.len(), 1);
             assert!(has_validation(&results[0], Validation::NonImperative));
         }
@@ -1365,6 +1574,7 @@ mod tests {
                 author_name: "Test".to_string(),
                 author_email: "test@example.com".to_string(),
                 subject: subject.to_string(),
+                validate_cache: Default::default(),
             }
         }
 
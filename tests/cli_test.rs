@@ -61,6 +61,29 @@ fn limit_flag_restricts_commits_analyzed() {
     );
 }
 
+#[test]
+fn limit_zero_reports_acceptable() {
+    let output = run_binary_with_args(&["--limit", "0"]);
+    assert!(output.status.success(), "Should exit zero with --limit 0");
+    let stdout = String::from_utf8_lossy(&output.stdout);
+    assert!(
+        stdout.contains("adequately executed"),
+        "Should report acceptable commits with --limit 0, got: {}",
+        stdout
+    );
+}
+
+#[test]
+fn limit_zero_with_quiet_prints_nothing() {
+    let output = run_binary_with_args(&["--limit", "0", "--quiet"]);
+    assert!(output.status.success(), "Should exit zero with --limit 0");
+    assert!(
+        output.stdout.is_empty(),
+        "Should print nothing in quiet mode, got: {}",
+        String::from_utf8_lossy(&output.stdout)
+    );
+}
+
 #[test]
 fn threshold_flag_changes_character_limit() {
     let output = run_binary_with_args(&["--threshold", "1000", "-l", "3"]);
@@ -0,0 +1,17 @@
+import os
+
+import mixed_pickles
+import pytest
+
+
+@pytest.fixture(scope="session")
+def repo():
+    """Open the current repository once and share it across the test session.
+
+    Set MIXED_PICKLES_COMMIT_GRAPH=1 to write a commit-graph for it first.
+    """
+    repository = mixed_pickles.Repository(".")
+    if os.environ.get("MIXED_PICKLES_COMMIT_GRAPH"):
+        repository.write_commit_graph()
+    return repository
+
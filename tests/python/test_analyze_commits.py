@@ -2,70 +2,56 @@ import mixed_pickles
 import pytest
 
 
+@pytest.fixture
+def error_config():
+    """Build a config that fails on one validation."""
+
+    def build(validation, threshold):
+        config = mixed_pickles.ValidationConfig(threshold=threshold)
+        config.set_severity(validation, mixed_pickles.Severity.Error)
+        return config
+
+    return build
+
+
 class TestAnalyzeCommits:
     """Tests for the analyze_commits function."""
 
-    def test_limit_zero(self):
+    def test_limit_zero(self, repo):
         """Should handle limit of zero (no commits analyzed)."""
-        mixed_pickles.analyze_commits(limit=0)
-
-    def test_raises_when_short_commits_found(self):
-        """Should raise RuntimeError when validation issues are found."""
-        config = mixed_pickles.ValidationConfig(threshold=1000)
-        config.set_severity(
-            mixed_pickles.Validation.ShortCommit, mixed_pickles.Severity.Error
-        )
-        with pytest.raises(RuntimeError, match="validation issues"):
-            mixed_pickles.analyze_commits(config=config)
-
-    def test_raises_with_quiet_when_issues_found(self):
-        """Should still raise even in quiet mode when issues found."""
-        config = mixed_pickles.ValidationConfig(threshold=1000)
-        config.set_severity(
-            mixed_pickles.Validation.ShortCommit, mixed_pickles.Severity.Error
-        )
-        with pytest.raises(RuntimeError, match="validation issues"):
-            mixed_pickles.analyze_commits(quiet=True, config=config)
+        mixed_pickles.analyze_commits(limit=0, repo=repo)
 
-    def test_validates_missing_reference(self):
-        """Should detect commits missing issue references."""
-        config = mixed_pickles.ValidationConfig(threshold=0)
-        config.set_severity(
-            mixed_pickles.Validation.MissingReference, mixed_pickles.Severity.Error
-        )
-        # Most real commits lack issue references, so this should raise
+    @pytest.mark.parametrize("quiet", [False, True])
+    def test_raises_when_short_commits_found(self, repo, error_config, quiet):
+        """Should raise RuntimeError when issues are found, even in quiet mode."""
+        config = error_config(mixed_pickles.Validation.ShortCommit, threshold=1000)
         with pytest.raises(RuntimeError, match="validation issues"):
-            mixed_pickles.analyze_commits(limit=5, config=config)
-
-    def test_validates_with_multiple_error_types(self):
-        """Should detect commits based on configured error types."""
-        config = mixed_pickles.ValidationConfig(threshold=0)
-        config.set_severity(
-            mixed_pickles.Validation.MissingReference, mixed_pickles.Severity.Error
-        )
+            mixed_pickles.analyze_commits(
+                limit=5, quiet=quiet, config=config, repo=repo
+            )
+
+    @pytest.mark.parametrize("use_path", [False, True])
+    def test_validates_missing_reference(self, repo, error_config, use_path):
+        """Should detect commits missing issue references, via repo or explicit path."""
+        config = error_config(mixed_pickles.Validation.MissingReference, threshold=0)
+        target = {"path": "."} if use_path else {"repo": repo}
         # Most real commits lack issue references, so this should raise
         with pytest.raises(RuntimeError, match="validation issues"):
-            mixed_pickles.analyze_commits(limit=5, config=config)
-
-    def test_with_path_validates_commits(self):
-        """Should validate commits when using explicit path."""
-        config = mixed_pickles.ValidationConfig(threshold=0)
-        config.set_severity(
-            mixed_pickles.Validation.MissingReference, mixed_pickles.Severity.Error
-        )
-        with pytest.raises(RuntimeError, match="validation issues"):
-            mixed_pickles.analyze_commits(path=".", limit=5, config=config)
-
-
-class TestAnalyzeCommitsErrors:
-    """Tests for error handling in analyze_commits."""
-
-    def test_non_existent_path(self):
-        """Should raise error for non-existent path."""
-        with pytest.raises(RuntimeError, match="does not exist|PathNotFound"):
-            mixed_pickles.analyze_commits(path="/this/path/does/not/exist")
-
-    def test_path_not_a_repository(self):
-        """Should raise error when path is not a git repository."""
-        with pytest.raises(RuntimeError, match="not a git repository|NotARepository"):
-            mixed_pickles.analyze_commits(path="/tmp")
+            mixed_pickles.analyze_commits(limit=5, config=config, **target)
+
+    @pytest.mark.parametrize(
+        ("path", "match"),
+        [
+            ("/this/path/does/not/exist", "does not exist|PathNotFound"),
+            ("/tmp", "not a git repository|NotARepository"),
+        ],
+    )
+    def test_invalid_path(self, path, match):
+        """Should raise error for non-existent paths and non-repositories."""
+        with pytest.raises(RuntimeError, match=match):
+            mixed_pickles.analyze_commits(path=path)
+
+    def test_rejects_path_and_repo(self, repo):
+        """Should raise error when both path and repo are given."""
+        with pytest.raises(ValueError, match="either path or repo"):
+            mixed_pickles.analyze_commits(path=".", repo=repo)
@@ -1,13 +1,18 @@
+import os
+import re
+
 import mixed_pickles
 import pytest
 
+HASH_PATTERN = re.compile(r"[0-9a-f]{40}")
+
 
 class TestFetchCommits:
     """Tests for the fetch_commits function."""
 
-    def test_fetch_commits_returns_list(self):
+    def test_fetch_commits_returns_list(self, repo):
         """Should return a list of Commit objects."""
-        commits = mixed_pickles.fetch_commits(limit=5)
+        commits = mixed_pickles.fetch_commits(limit=5, repo=repo)
         assert isinstance(commits, list)
         assert len(commits) <= 5
 
@@ -16,9 +21,9 @@ class TestFetchCommits:
         commits = mixed_pickles.fetch_commits(path=".", limit=3)
         assert isinstance(commits, list)
 
-    def test_fetch_commits_limit_zero(self):
+    def test_fetch_commits_limit_zero(self, repo):
         """Should return empty list with limit=0."""
-        commits = mixed_pickles.fetch_commits(limit=0)
+        commits = mixed_pickles.fetch_commits(limit=0, repo=repo)
         assert commits == []
 
     def test_fetch_commits_non_existent_path(self):
@@ -31,21 +36,84 @@ class TestFetchCommits:
         with pytest.raises(RuntimeError, match="not a git repository|NotARepository"):
             mixed_pickles.fetch_commits(path="/tmp")
 
+    def test_fetch_commits_rejects_path_and_repo(self, repo):
+        """Should raise error when both path and repo are given."""
+        with pytest.raises(ValueError, match="either path or repo"):
+            mixed_pickles.fetch_commits(path=".", repo=repo)
+
+
+class TestFetchCommitBatch:
+    """Tests for the fetch_commit_batch function."""
+
+    def test_batch_matches_fetch_commits(self, repo):
+        """Batch items should match the commits returned by fetch_commits."""
+        batch = mixed_pickles.fetch_commit_batch(limit=5, repo=repo)
+        commits = mixed_pickles.fetch_commits(limit=5, repo=repo)
+        assert len(batch) == len(commits)
+        assert [c.hash for c in batch] == [c.hash for c in commits]
+        assert batch.subjects == [c.subject for c in commits]
+
+    def test_batch_columns(self, repo):
+        """Batch should expose one list per field."""
+        batch = mixed_pickles.fetch_commit_batch(limit=3, repo=repo)
+        assert len(batch.hashes) == len(batch)
+        assert len(batch.author_names) == len(batch)
+        assert len(batch.author_emails) == len(batch)
+        assert len(batch.subjects) == len(batch)
+
+    def test_batch_negative_index(self, repo):
+        """Negative indices should count from the end."""
+        batch = mixed_pickles.fetch_commit_batch(limit=2, repo=repo)
+        assert batch[-1].hash == batch[len(batch) - 1].hash
+
+    def test_batch_index_out_of_range(self, repo):
+        """Out-of-range indices should raise IndexError."""
+        batch = mixed_pickles.fetch_commit_batch(limit=1, repo=repo)
+        with pytest.raises(IndexError):
+            batch[len(batch)]
+
+    def test_batch_limit_zero(self, repo):
+        """Should return an empty batch with limit=0."""
+        batch = mixed_pickles.fetch_commit_batch(limit=0, repo=repo)
+        assert len(batch) == 0
+        assert list(batch) == []
+
+
+class TestRepository:
+    """Tests for the Repository class."""
+
+    def test_repository_path(self, repo):
+        """Repository should expose the resolved absolute path it was opened with."""
+        assert repo.path == os.path.realpath(".")
+
+    def test_repository_repr(self, repo):
+        """Repository should have readable repr."""
+        assert "Repository" in repr(repo)
+
+    def test_repository_non_existent_path(self):
+        """Should raise error for non-existent path."""
+        with pytest.raises(RuntimeError, match="does not exist|PathNotFound"):
+            mixed_pickles.Repository("/this/path/does/not/exist")
+
+    def test_repository_not_a_repository(self):
+        """Should raise error when path is not a git repository."""
+        with pytest.raises(RuntimeError, match="not a git repository|NotARepository"):
+            mixed_pickles.Repository("/tmp")
+
 
 class TestCommit:
     """Tests for the Commit class."""
 
     @pytest.fixture
-    def commit(self):
+    def commit(self, repo):
         """Get a single commit for testing."""
-        commits = mixed_pickles.fetch_commits(limit=1)
+        commits = mixed_pickles.fetch_commits(limit=1, repo=repo)
         assert len(commits) == 1
         return commits[0]
 
     def test_commit_has_hash(self, commit):
         """Commit should have a 40-character hash."""
-        assert len(commit.hash) == 40
-        assert all(c in "0123456789abcdef" for c in commit.hash)
+        assert HASH_PATTERN.fullmatch(commit.hash)
 
     def test_commit_has_author_name(self, commit):
         """Commit should have an author name."""
@@ -97,12 +165,31 @@ class TestValidation:
         """Validation should have human-readable string representation."""
         assert str(mixed_pickles.Validation.ShortCommit) == "Short commit message"
         assert (
-            "issue reference" in str(mixed_pickles.Validation.MissingReference).lower()
+            str(mixed_pickles.Validation.MissingReference)
+            == "Missing issue reference (e.g., #123)"
+        )
+        assert (
+            str(mixed_pickles.Validation.InvalidFormat)
+            == "Invalid format (expected: type: description)"
+        )
+        assert (
+            str(mixed_pickles.Validation.VagueLanguage)
+            == "Vague language (e.g., 'fix bug', 'update code')"
         )
-        assert "format" in str(mixed_pickles.Validation.InvalidFormat).lower()
-        assert "vague" in str(mixed_pickles.Validation.VagueLanguage).lower()
-        assert "wip" in str(mixed_pickles.Validation.WipCommit).lower()
-        assert "imperative" in str(mixed_pickles.Validation.NonImperative).lower()
+        assert (
+            str(mixed_pickles.Validation.WipCommit)
+            == "Work-in-progress commit (e.g., 'WIP', 'fixup!')"
+        )
+        assert (
+            str(mixed_pickles.Validation.NonImperative)
+            == "Non-imperative mood (use 'Add' not 'Added')"
+        )
+
+    def test_validation_str_is_shared(self):
+        """Repeated str() and repr() calls should return the same string object."""
+        validation = mixed_pickles.Validation.VagueLanguage
+        assert str(validation) is str(validation)
+        assert repr(validation) is repr(validation)
 
     def test_validation_repr(self):
         """Validation should have debug representation."""
@@ -146,14 +233,27 @@ class TestValidation:
             mixed_pickles.Validation.WipCommit != mixed_pickles.Validation.NonImperative
         )
 
+    def test_validation_hashable(self):
+        """Validation variants should be usable as dict keys."""
+        counts = {
+            mixed_pickles.Validation.ShortCommit: 1,
+            mixed_pickles.Validation.WipCommit: 2,
+        }
+        assert counts[mixed_pickles.Validation.ShortCommit] == 1
+        variants = {
+            mixed_pickles.Validation.WipCommit,
+            mixed_pickles.Validation.WipCommit,
+        }
+        assert len(variants) == 1
+
 
 class TestCommitValidate:
     """Tests for Commit.validate() method."""
 
     @pytest.fixture
-    def commit(self):
+    def commit(self, repo):
         """Get a single commit for testing."""
-        commits = mixed_pickles.fetch_commits(limit=1)
+        commits = mixed_pickles.fetch_commits(limit=1, repo=repo)
         assert len(commits) == 1
         return commits[0]
 
@@ -177,3 +277,27 @@ class TestCommitValidate:
         failures = commit.validate()
         # Just verify it runs without error
         assert isinstance(failures, list)
+
+    def test_validate_repeated_calls_are_consistent(self, commit):
+        """Cached validate() results should match fresh ones per threshold."""
+        assert commit.validate(threshold=1000) == commit.validate(threshold=1000)
+        assert mixed_pickles.Validation.ShortCommit not in commit.validate(threshold=0)
+        assert mixed_pickles.Validation.ShortCommit in commit.validate(threshold=1000)
+
+    def test_validate_with_config(self, commit):
+        """validate() should use the given config instead of threshold."""
+        config = mixed_pickles.ValidationConfig(threshold=1000)
+        failures = commit.validate(threshold=0, config=config)
+        assert mixed_pickles.Validation.ShortCommit in failures
+
+    def test_validate_with_config_respects_disabled_checks(self, commit):
+        """validate() should skip checks disabled in the given config."""
+        config = mixed_pickles.ValidationConfig(
+            threshold=0,
+            require_issue_ref=False,
+            require_conventional_format=False,
+            check_vague_language=False,
+            check_wip=False,
+            check_imperative=False,
+        )
+        assert commit.validate(config=config) == []
@@ -150,27 +150,36 @@ class TestSeverityEnum:
         assert repr(mixed_pickles.Severity.Error) == "Severity.Error"
         assert repr(mixed_pickles.Severity.Warning) == "Severity.Warning"
 
+    def test_severity_str_is_shared(self):
+        """Repeated str() calls should return the same string object."""
+        assert str(mixed_pickles.Severity.Error) is str(mixed_pickles.Severity.Error)
+
+    def test_severity_hashable(self):
+        """Severity variants should be usable in sets."""
+        severities = {mixed_pickles.Severity.Error, mixed_pickles.Severity.Error}
+        assert severities == {mixed_pickles.Severity.Error}
+
 
 class TestAnalyzeCommitsWithConfig:
     """Tests for analyze_commits with ValidationConfig."""
 
-    def test_analyze_with_config_no_issue_ref(self):
+    def test_analyze_with_config_no_issue_ref(self, repo):
         """Should not raise when issue ref check is disabled."""
         config = mixed_pickles.ValidationConfig(require_issue_ref=False)
         # This should not raise for missing references
         # We analyze with limit=0 to avoid any actual validation
-        mixed_pickles.analyze_commits(limit=0, config=config)
+        mixed_pickles.analyze_commits(limit=0, config=config, repo=repo)
 
-    def test_analyze_with_config_custom_threshold(self):
+    def test_analyze_with_config_custom_threshold(self, repo):
         """Should respect custom threshold from config."""
         config = mixed_pickles.ValidationConfig(threshold=0)
         # With threshold=0, ShortCommit should never trigger
         config.set_severity(
             mixed_pickles.Validation.ShortCommit, mixed_pickles.Severity.Error
         )
-        mixed_pickles.analyze_commits(limit=1, config=config)
+        mixed_pickles.analyze_commits(limit=1, config=config, repo=repo)
 
-    def test_analyze_with_disabled_checks(self):
+    def test_analyze_with_disabled_checks(self, repo):
         """Should skip validation when checks are disabled."""
         config = mixed_pickles.ValidationConfig(
             require_issue_ref=False,
@@ -181,25 +190,25 @@ class TestAnalyzeCommitsWithConfig:
             threshold=0,
         )
         # With all checks disabled and threshold=0, nothing should fail
-        mixed_pickles.analyze_commits(limit=5, config=config)
+        mixed_pickles.analyze_commits(limit=5, config=config, repo=repo)
 
-    def test_analyze_with_severity_error_raises(self):
+    def test_analyze_with_severity_error_raises(self, repo):
         """Should raise when validation set to Error severity fails."""
         config = mixed_pickles.ValidationConfig(threshold=1000)
         config.set_severity(
             mixed_pickles.Validation.ShortCommit, mixed_pickles.Severity.Error
         )
         with pytest.raises(RuntimeError, match="validation issues"):
-            mixed_pickles.analyze_commits(limit=5, config=config)
+            mixed_pickles.analyze_commits(limit=5, config=config, repo=repo)
 
-    def test_analyze_with_severity_ignore_does_not_raise(self):
+    def test_analyze_with_severity_ignore_does_not_raise(self, repo):
         """Should not raise when validation set to Ignore severity."""
         config = mixed_pickles.ValidationConfig(threshold=1000)
         config.set_severity(
             mixed_pickles.Validation.ShortCommit, mixed_pickles.Severity.Ignore
         )
         # Even with high threshold, Ignore severity means no error
-        mixed_pickles.analyze_commits(limit=1, config=config)
+        mixed_pickles.analyze_commits(limit=1, config=config, repo=repo)
 
 
 class TestValidationConfigBranches: